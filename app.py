@@ -1,11 +1,20 @@
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest
 import os
+import atexit
+import hashlib
 import logging
 import time
+import re
+import string
 import threading
-from queue import Queue
+import unicodedata
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Import deep-translator
 try:
@@ -16,32 +25,199 @@ except ImportError:
     TRANSLATOR_AVAILABLE = False
     logging.warning("⚠️ deep-translator not available. Run: pip install deep-translator")
 
+# Languages the app translates between (deep-translator name -> code)
+SUPPORTED_LANGUAGES = {
+    "english": "en",
+    "hindi": "hi",
+    "tamil": "ta",
+    "telugu": "te",
+    "kannada": "kn",
+    "malayalam": "ml"
+}
+SUPPORTED_LANGUAGE_CODES = frozenset(SUPPORTED_LANGUAGES.values())
+
+if TRANSLATOR_AVAILABLE:
+    import requests
+    import deep_translator.google
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    class _PooledRequests:
+        """Stands in for the requests module so deep-translator reuses one keep-alive session"""
+        def __init__(self, session):
+            self._session = session
+        
+        def get(self, *args, **kwargs):
+            # deep-translator passes no timeout; don't let a stalled connection hang the request
+            kwargs.setdefault("timeout", 10)
+            return self._session.get(*args, **kwargs)
+        
+        def __getattr__(self, name):
+            return getattr(requests, name)
+    
+    _HTTP_SESSION = requests.Session()
+    _HTTP_SESSION.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    ))
+    deep_translator.google.requests = _PooledRequests(_HTTP_SESSION)
+    
+    class MinimalGoogleTranslator(GoogleTranslator):
+        """GoogleTranslator restricted to the languages this app supports"""
+        def __init__(self, source="auto", target="en", **kwargs):
+            for code in (source, target):
+                if code != "auto" and code not in SUPPORTED_LANGUAGE_CODES:
+                    raise ValueError(f"Unsupported language: {code}")
+            super().__init__(source=source, target=target, languages=SUPPORTED_LANGUAGES, **kwargs)
+
+# Import orjson (optional, faster JSON for request/response bodies)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import pyahocorasick (optional, used for gesture keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Import redis (optional, shared translation cache across processes)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (UTF-8 output, no ASCII escaping)"""
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.OPTIONS).decode("utf-8")
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.OPTIONS), mimetype="application/json")
+
 app = Flask(__name__, template_folder="templates", static_folder="static")
-app.config["JSON_AS_ASCII"] = False
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+else:
+    app.json.ensure_ascii = False
 app.config['MAX_CONTENT_LENGTH'] = 20 * 1024 * 1024
+VISION_MAX_BODY = 4 * 1024 * 1024
 app.secret_key = os.environ.get("SECRET_KEY", "change-this-in-production")
 
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-vision_sessions = {}
+# Bounded pool for vision workers; extra sessions wait for a free worker
+VISION_MAX_WORKERS = int(os.environ.get("VISION_MAX_WORKERS", 8))
+VISION_POOL = ThreadPoolExecutor(max_workers=VISION_MAX_WORKERS, thread_name_prefix="vision")
+VISION_INTERVAL = 5.0
+
+# Pool for overlapping per-request work with network-bound translation; sized like
+# gunicorn's request threads (gunicorn.conf.py) so every request thread can use it at once
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("GUNICORN_THREADS", 2 * (os.cpu_count() or 1) + 1)),
+    thread_name_prefix="io"
+)
 
 class VisionSession:
     def __init__(self, session_id, language):
         self.session_id = session_id
         self.language = language
         self.active = True
-        self.queue = Queue(maxsize=5)
-        self.thread = None
+        # deque append/popleft are atomic; maxlen drops the oldest result when full
+        self.queue = deque(maxlen=2)
+        self.poll_event = threading.Event()
+        self.future = None
         self.last_activity = time.time()
     
     def stop(self):
         self.active = False
+        self.poll_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+class SessionRegistry:
+    """Thread-safe session map kept in least-recently-active order"""
+    def __init__(self):
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+    
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+    
+    def put(self, session):
+        """Register a session, returning the one it replaced (if any)"""
+        with self._lock:
+            previous = self._sessions.pop(session.session_id, None)
+            self._sessions[session.session_id] = session
+            return previous
+    
+    def pop(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+    
+    def touch(self, session_id):
+        """Mark a session as active now and return it"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_activity = time.time()
+                self._sessions.move_to_end(session_id)
+            return session
+    
+    def pop_all(self):
+        """Remove and return every session"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        return sessions
+    
+    def pop_expired(self, max_idle):
+        """Remove and return sessions idle for longer than max_idle seconds"""
+        cutoff = time.time() - max_idle
+        expired = []
+        with self._lock:
+            while self._sessions:
+                session_id, session = next(iter(self._sessions.items()))
+                if session.last_activity >= cutoff:
+                    break
+                del self._sessions[session_id]
+                expired.append(session)
+        return expired
+
+vision_sessions = SessionRegistry()
+SESSION_TIMEOUT = 300
+
+def _shutdown_vision():
+    """Stop every session so the pool's non-daemon workers can exit"""
+    for session in vision_sessions.pop_all():
+        session.stop()
+    VISION_POOL.shutdown(wait=False, cancel_futures=True)
+
+# ThreadPoolExecutor joins its workers from threading's shutdown hook, which runs
+# before atexit handlers; register there so live sessions are stopped first
+getattr(threading, "_register_atexit", atexit.register)(_shutdown_vision)
 
 # ==================== TRANSLATION HELPERS ====================
 
@@ -61,6 +237,73 @@ LANGUAGE_MAP = {
     'auto': 'auto'
 }
 
+@lru_cache(maxsize=64)
+def _normalize_lang_tag(tag):
+    tag = tag.split("-", 1)[0]
+    return LANGUAGE_MAP.get(tag, tag)
+
+def _normalize_lang(tag):
+    """Map a language tag like 'hi-IN' to its translator code ('hi')"""
+    # Checked before the cache: lru_cache would hash (and choke on) lists/dicts
+    if not isinstance(tag, str) or not tag:
+        return "en"
+    return _normalize_lang_tag(tag)
+
+# GoogleTranslator.translate() stores the query text on the instance before
+# sending it, so instances must not be shared between threads
+_translators = threading.local()
+
+def _get_translator(src, tgt):
+    """One GoogleTranslator per (source, target) pair, per thread"""
+    cache = getattr(_translators, "by_pair", None)
+    if cache is None:
+        cache = _translators.by_pair = {}
+    translator = cache.get((src, tgt))
+    if translator is None:
+        translator = cache[(src, tgt)] = MinimalGoogleTranslator(source=src, target=tgt)
+    return translator
+
+class TranslationCache:
+    """Write-through translation cache in Redis, enabled when REDIS_URL is set"""
+    TTL = 7 * 24 * 3600
+    
+    def __init__(self, url=None):
+        self._redis = None
+        if url and REDIS_AVAILABLE:
+            self._redis = redis.Redis.from_url(url, socket_timeout=0.5)
+            logger.info("✅ Redis translation cache enabled")
+    
+    @staticmethod
+    def key(src, tgt, text):
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"tx:{src}:{tgt}:{digest}"
+    
+    def translate(self, src, tgt, text):
+        if self._redis is None:
+            return _get_translator(src, tgt).translate(text)
+        
+        key = self.key(src, tgt, text)
+        try:
+            cached = self._redis.get(key)
+            if cached is not None:
+                return cached.decode("utf-8")
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis read failed: {e}")
+        
+        translated = _get_translator(src, tgt).translate(text)
+        try:
+            self._redis.setex(key, self.TTL, translated)
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis write failed: {e}")
+        return translated
+
+translation_cache = TranslationCache(os.environ.get("REDIS_URL"))
+
+@lru_cache(maxsize=4096)
+def _translate_cached(src, tgt, text):
+    """Translate with an in-process cache; failures are not cached"""
+    return translation_cache.translate(src, tgt, text)
+
 def translate_text(text, source_lang='auto', target_lang='en'):
     """
     Translate text using deep-translator (GoogleTranslator)
@@ -72,9 +315,11 @@ def translate_text(text, source_lang='auto', target_lang='en'):
     if not text or not text.strip():
         return text
     
+    text = text.strip()
+    
     # Map language codes
-    src = LANGUAGE_MAP.get(source_lang, source_lang)
-    tgt = LANGUAGE_MAP.get(target_lang, target_lang)
+    src = _normalize_lang(source_lang)
+    tgt = _normalize_lang(target_lang)
     
     # No translation needed if same language
     if src == tgt and src != 'auto':
@@ -83,8 +328,7 @@ def translate_text(text, source_lang='auto', target_lang='en'):
     try:
         logger.info(f"🌐 Translating [{src}] → [{tgt}]: '{text[:50]}...'")
         
-        translator = GoogleTranslator(source=src, target=tgt)
-        translated = translator.translate(text)
+        translated = _translate_cached(src, tgt, text)
         
         logger.info(f"✅ Translation result: '{translated[:50]}...'")
         return translated
@@ -93,6 +337,25 @@ def translate_text(text, source_lang='auto', target_lang='en'):
         logger.error(f"❌ Translation error: {e}")
         return text  # Return original on error
 
+def translate_texts(texts, source_lang='auto', target_lang='en'):
+    """
+    Translate a list of texts, translating each distinct string only once
+    """
+    unique = {text: None for text in texts}
+    for text in unique:
+        unique[text] = translate_text(text, source_lang, target_lang)
+    return [unique[text] for text in texts]
+
+def read_json():
+    """Parse the request body as JSON without caching the raw bytes"""
+    body = request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        return app.json.loads(body) or {}
+    except ValueError as e:
+        raise BadRequest(f"Invalid JSON: {e}")
+
 # ==================== ROUTES ====================
 
 @app.route("/")
@@ -117,14 +380,25 @@ def api_translate():
     """
     Translate text between languages
     Request: { "text": "...", "source": "hi", "target": "en" }
-    Response: { "translated_text": "..." }
+             or { "texts": ["...", "..."], "source": "hi", "target": "en" }
+    Response: { "translated_text": "..." } or { "translated_texts": [...] }
     """
     try:
-        data = request.get_json(force=True) or {}
+        data = read_json()
         text = data.get("text", "")
+        texts = data.get("texts")
         source_lang = data.get("source", "auto")
         target_lang = data.get("target", "en")
         
+        if isinstance(texts, list) and texts:
+            if not all(isinstance(item, str) for item in texts):
+                return jsonify({"error": "texts must be a list of strings"}), 400
+            return jsonify({
+                "translated_texts": translate_texts(texts, source_lang, target_lang),
+                "source_lang": source_lang,
+                "target_lang": target_lang
+            })
+        
         if not text:
             return jsonify({"error": "No text provided"}), 400
         
@@ -142,6 +416,41 @@ def api_translate():
 
 # ==================== PHI ENDPOINT WITH TRANSLATION ====================
 
+_EDGE_PUNCTUATION = string.punctuation + "।¿¡ "
+
+def normalize_message(text):
+    """Canonical form of a chat message for response caching"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(text.split()).strip(_EDGE_PUNCTUATION)
+
+PHI_REPLY_CACHE_SIZE = 1024
+_phi_reply_cache = OrderedDict()
+_phi_reply_lock = threading.Lock()
+
+def _ask_phi_cached(lang, normalized_msg, user_input):
+    """Phi reply for user_input, memoized on its normalized form ("hi", "what is ai");
+    fallback error replies are returned but never cached"""
+    from phi import _ERROR_MESSAGES, _TECHNICAL_ERROR_MESSAGES, ask_phi_with_emotion
+    
+    key = (lang, normalized_msg)
+    with _phi_reply_lock:
+        cached = _phi_reply_cache.get(key)
+        if cached is not None:
+            _phi_reply_cache.move_to_end(key)
+            return cached
+    
+    result = ask_phi_with_emotion(user_input, lang=lang)
+    reply = result[0]
+    if reply in _ERROR_MESSAGES.values() or reply in _TECHNICAL_ERROR_MESSAGES.values():
+        return result
+    
+    with _phi_reply_lock:
+        _phi_reply_cache[key] = result
+        _phi_reply_cache.move_to_end(key)
+        if len(_phi_reply_cache) > PHI_REPLY_CACHE_SIZE:
+            _phi_reply_cache.popitem(last=False)
+    return result
+
 @app.route("/phi", methods=["POST"])
 def phi_endpoint():
     """✅ Main Phi AI chat endpoint with automatic translation"""
@@ -151,7 +460,7 @@ def phi_endpoint():
     logger.info("📥 /phi ENDPOINT CALLED")
     
     try:
-        data = request.get_json(force=True) or {}
+        data = read_json()
         logger.info(f"✅ Received: {data}")
     except Exception as e:
         logger.error(f"❌ JSON parse error: {e}")
@@ -175,11 +484,7 @@ def phi_endpoint():
     
     try:
         user_input = data.get("user_input") or data.get("message") or data.get("text") or ""
-        lang = data.get("language", "en")
-        
-        # Normalize language code
-        if isinstance(lang, str) and "-" in lang:
-            lang = lang.split("-")[0]
+        lang = _normalize_lang(data.get("language", "en"))
         
         logger.info(f"🗣️ User [{lang}]: '{user_input}'")
         
@@ -197,9 +502,13 @@ def phi_endpoint():
             user_input = translate_text(user_input, source_lang=lang, target_lang='en')
             logger.info(f"✅ Translated: '{original_input}' → '{user_input}'")
         
-        # 🤖 Get AI response in English
+        # 🤖 Get AI response in English (cached on the normalized message)
         logger.info(f"🤖 Calling ask_phi_with_emotion with English input...")
-        reply, emotion, intensity = ask_phi_with_emotion(user_input, lang='en')
+        normalized_input = normalize_message(user_input)
+        if data.get("no_cache") or not normalized_input:
+            reply, emotion, intensity = ask_phi_with_emotion(user_input, lang='en')
+        else:
+            reply, emotion, intensity = _ask_phi_cached('en', normalized_input, user_input)
         logger.info(f"✅ AI Response (English): '{reply[:50]}...'")
         
         # 🔄 TRANSLATE BACK to user's language if not English
@@ -232,8 +541,24 @@ def phi_endpoint():
 
 @app.route("/api/vision", methods=["POST"])
 def api_vision():
+    """
+    Run one vision cycle
+    Send { "stream": true } or Accept: application/x-ndjson to receive an
+    "emotion" record first and the translated "final" record after it.
+    """
     start_time = time.time()
-    data = request.get_json(force=True) or {}
+    
+    # Reject oversize images before reading and parsing the body
+    if request.content_length and request.content_length > VISION_MAX_BODY:
+        return jsonify({
+            "response": "Image too large.",
+            "emotion": "neutral",
+            "emotion_intensity": 0.5,
+            "detections": [],
+            "error": f"Payload exceeds {VISION_MAX_BODY // (1024 * 1024)} MB"
+        }), 413
+    
+    data = read_json()
     
     logger.info(f"📥 /api/vision - Image: {bool(data.get('image_data'))}, Input: {data.get('user_input', '')[:30]}")
     
@@ -250,30 +575,18 @@ def api_vision():
         }), 500
     
     try:
-        result = vision_assistant_cycle(data)
-        
-        response_text = result.get("response") or "I couldn't process that."
-        emotion = result.get("emotion", "neutral")
-        intensity = result.get("emotion_intensity", 0.5)
-        source = result.get("source", "unknown")
-        objects_count = result.get("objects_count", 0)
-        detections = result.get("detections", [])
-        
-        elapsed = time.time() - start_time
-        logger.info(f"✅ /api/vision [{elapsed:.2f}s] - {source}, objects: {objects_count}")
         # Get language from request
-        lang = data.get("language", "en")
-        if isinstance(lang, str) and "-" in lang:
-            lang = lang.split("-")[0]
+        lang = _normalize_lang(data.get("language", "en"))
         
         result = vision_assistant_cycle(data)
         
         response_text = result.get("response") or "I couldn't process that."
         
         # 🔄 Translate vision response if not English
+        translation_future = None
         if lang != 'en':
             logger.info(f"🌐 Translating vision response to {lang}...")
-            response_text = translate_text(response_text, source_lang='en', target_lang=lang)
+            translation_future = _IO_POOL.submit(translate_text, response_text, 'en', lang)
         
         emotion = result.get("emotion", "neutral")
         intensity = result.get("emotion_intensity", 0.5)
@@ -281,6 +594,31 @@ def api_vision():
         objects_count = result.get("objects_count", 0)
         detections = result.get("detections", [])
         
+        if data.get("stream") or "application/x-ndjson" in request.headers.get("Accept", ""):
+            def generate():
+                # Emotion first so the avatar can react before translation finishes
+                yield app.json.dumps({
+                    "partial": "emotion",
+                    "emotion": emotion,
+                    "emotion_intensity": intensity
+                }) + "\n"
+                final_text = translation_future.result() if translation_future else response_text
+                yield app.json.dumps({
+                    "partial": "final",
+                    "response": final_text,
+                    "emotion": emotion,
+                    "emotion_intensity": intensity,
+                    "source": source,
+                    "objects_count": objects_count,
+                    "detections": detections
+                }) + "\n"
+                logger.info(f"✅ /api/vision stream [{time.time() - start_time:.2f}s] - {source}, objects: {objects_count}")
+            
+            return Response(generate(), mimetype="application/x-ndjson")
+        
+        if translation_future is not None:
+            response_text = translation_future.result()
+        
         elapsed = time.time() - start_time
         logger.info(f"✅ /api/vision [{elapsed:.2f}s] - {source}, objects: {objects_count}")
         
@@ -306,26 +644,21 @@ def api_vision():
 
 @app.route("/api/vision/start", methods=["POST"])
 def api_vision_start():
-    data = request.get_json(force=True) or {}
+    data = read_json()
     session_id = data.get("session_id") or str(time.time())
     language = data.get("language", "en-US")
     
     logger.info(f"👁️ Starting vision - Session: {session_id}")
     
-    if session_id in vision_sessions:
-        vision_sessions[session_id].stop()
-        del vision_sessions[session_id]
+    # Free pool slots held by abandoned sessions before queueing a new worker
+    cleanup_inactive_sessions()
     
     session = VisionSession(session_id, language)
-    vision_sessions[session_id] = session
+    previous = vision_sessions.put(session)
+    if previous is not None:
+        previous.stop()
     
-    thread = threading.Thread(
-        target=vision_monitoring_worker,
-        args=(session,),
-        daemon=True
-    )
-    thread.start()
-    session.thread = thread
+    session.future = VISION_POOL.submit(vision_monitoring_worker, session)
     
     return jsonify({
         "status": "started",
@@ -335,20 +668,23 @@ def api_vision_start():
 
 @app.route("/api/vision/poll", methods=["POST"])
 def api_vision_poll():
-    data = request.get_json(force=True) or {}
+    data = read_json()
     session_id = data.get("session_id")
     
-    if not session_id or session_id not in vision_sessions:
+    session = vision_sessions.touch(session_id) if session_id else None
+    if session is None:
         return jsonify({"status": "no_session", "detections": []}), 404
     
-    session = vision_sessions[session_id]
-    session.last_activity = time.time()
+    session.poll_event.set()
     
-    if not session.queue.empty():
-        detection = session.queue.get()
-        
+    try:
+        detection = session.queue.popleft()
+    except IndexError:
+        detection = None
+    
+    if detection is not None:
         # 🔄 Translate detection response if needed
-        lang = session.language.split("-")[0] if isinstance(session.language, str) else "en"
+        lang = _normalize_lang(session.language)
         if lang != 'en' and 'response' in detection:
             detection['response'] = translate_text(
                 detection['response'], 
@@ -362,12 +698,12 @@ def api_vision_poll():
 
 @app.route("/api/vision/stop", methods=["POST"])
 def api_vision_stop():
-    data = request.get_json(force=True) or {}
+    data = read_json()
     session_id = data.get("session_id")
     
-    if session_id and session_id in vision_sessions:
-        vision_sessions[session_id].stop()
-        del vision_sessions[session_id]
+    session = vision_sessions.pop(session_id) if session_id else None
+    if session is not None:
+        session.stop()
         logger.info(f"🛑 Vision stopped - Session: {session_id}")
         return jsonify({"status": "stopped"})
     
@@ -381,7 +717,7 @@ def vision_monitoring_worker(session: VisionSession):
         logger.error(f"Failed to import: {e}")
         return
     
-    lang_code = session.language.split("-")[0] if isinstance(session.language, str) else "en"
+    lang_code = _normalize_lang(session.language)
     
     logger.info(f"🔄 Vision worker started [{lang_code}]")
     
@@ -433,51 +769,62 @@ def vision_monitoring_worker(session: VisionSession):
                     'emotion_intensity': intensity
                 }
             
-            if session.queue.full():
-                try:
-                    session.queue.get_nowait()
-                except:
-                    pass
-            
-            session.queue.put(result)
+            session.queue.append(result)
             logger.info(f"📤 Queued: {result.get('objects_count', 0)} objects")
             
-            time.sleep(5)
-            
         except Exception as e:
             logger.error(f"❌ Vision worker error: {e}")
-            time.sleep(5)
+        
+        # Wake early when a client polls, otherwise scan every VISION_INTERVAL seconds
+        session.poll_event.wait(timeout=VISION_INTERVAL)
+        session.poll_event.clear()
     
     logger.info(f"🛑 Vision worker ended")
 
 def cleanup_inactive_sessions():
-    current_time = time.time()
-    inactive = []
-    
-    for session_id, session in vision_sessions.items():
-        if current_time - session.last_activity > 300:
-            inactive.append(session_id)
-    
-    for session_id in inactive:
-        vision_sessions[session_id].stop()
-        del vision_sessions[session_id]
-        logger.info(f"🧹 Cleaned: {session_id}")
+    for session in vision_sessions.pop_expired(SESSION_TIMEOUT):
+        session.stop()
+        logger.info(f"🧹 Cleaned: {session.session_id}")
+
+# Checked in order; the first gesture with a matching keyword wins
+GESTURES = {
+    "wave": ["hi", "hello", "hey", "नमस्ते", "வணக்கம்", "నమస్కారం"],
+    "nod": ["yes", "yeah", "हां", "ஆம்", "అవును"],
+    "shake_head": ["no", "nope", "नहीं", "இல்லை", "కాదు"],
+    "gratitude": ["thank", "thanks", "धन्यवाद", "நன்றி", "ధన్యవాదాలు"],
+    "thinking": ["?", "what", "how", "why", "क्या", "என்ன", "ఏమిటి"],
+}
+
+_GESTURE_PATTERNS = [
+    (gesture, re.compile("|".join(map(re.escape, words)), re.IGNORECASE))
+    for gesture, words in GESTURES.items()
+]
+
+_GESTURE_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _GESTURE_AUTOMATON = ahocorasick.Automaton()
+    for _rank, (_gesture, _words) in enumerate(GESTURES.items()):
+        for _word in _words:
+            _key = _word.lower()
+            # Keep the higher-priority gesture for keywords listed twice
+            if _key not in _GESTURE_AUTOMATON:
+                _GESTURE_AUTOMATON.add_word(_key, (_rank, _gesture))
+    _GESTURE_AUTOMATON.make_automaton()
 
 def detect_gesture(text: str) -> str:
-    lower = text.lower()
-    
-    if any(word in lower for word in ["hi", "hello", "hey", "नमस्ते", "வணக்கம்", "నమస్కారం"]):
-        return "wave"
-    elif any(word in lower for word in ["yes", "yeah", "हां", "ஆம்", "అవును"]):
-        return "nod"
-    elif any(word in lower for word in ["no", "nope", "नहीं", "இல்லை", "కాదు"]):
-        return "shake_head"
-    elif any(word in lower for word in ["thank", "thanks", "धन्यवाद", "நன்றி", "ధన్యవాదాలు"]):
-        return "gratitude"
-    elif any(word in lower for word in ["?", "what", "how", "why", "क्या", "என்ன", "ఏమిటి"]):
-        return "thinking"
-    else:
-        return "talk"
+    if _GESTURE_AUTOMATON is not None:
+        best = None
+        for _, match in _GESTURE_AUTOMATON.iter(text.lower()):
+            if best is None or match < best:
+                best = match
+                if best[0] == 0:
+                    break
+        return best[1] if best else "talk"
+    
+    for gesture, pattern in _GESTURE_PATTERNS:
+        if pattern.search(text):
+            return gesture
+    return "talk"
 
 @app.errorhandler(404)
 def not_found(error):
@@ -488,22 +835,8 @@ def internal_error(error):
     logger.exception("500 error")
     return jsonify({"error": "Internal error"}), 500
 
-if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 5000))
-    
-    logger.info("=" * 60)
-    logger.info("🚀 AI Digital Human Starting...")
-    logger.info("=" * 60)
-    logger.info(f"📍 Port: {port}")
-    logger.info(f"🌐 Translator: {'✅ Available' if TRANSLATOR_AVAILABLE else '❌ Not Available'}")
-    logger.info("📋 Endpoints:")
-    logger.info("   GET  /               - Frontend")
-    logger.info("   POST /phi            - AI chat (with auto-translation)")
-    logger.info("   POST /api/translate  - Manual translation")
-    logger.info("   POST /api/vision     - Vision")
-    logger.info("=" * 60)
-    
-    # ✅ TEST PHI ON STARTUP
+def _warmup():
+    """Smoke-test Phi and the translator off the startup path"""
     try:
         logger.info("🧪 Testing Phi...")
         from phi import ask_phi_with_emotion
@@ -512,9 +845,8 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"❌ PHI TEST FAILED: {e}")
         logger.error("⚠️ Ensure Ollama is running: ollama serve")
-        logger.error("⚠️ Ensure Phi downloaded: ollama pull phi")
+        logger.error("⚠️ Ensure Phi downloaded: ollama pull phi3:mini")
     
-    # ✅ TEST TRANSLATOR
     if TRANSLATOR_AVAILABLE:
         try:
             logger.info("🧪 Testing Translator...")
@@ -522,7 +854,30 @@ if __name__ == "__main__":
             logger.info(f"✅ Translator test OK: 'Hello' → '{test_translation}'")
         except Exception as e:
             logger.error(f"❌ TRANSLATOR TEST FAILED: {e}")
+
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", 5000))
+    
+    logger.info("=" * 60)
+    logger.info("🚀 AI Digital Human Starting...")
+    logger.info("=" * 60)
+    logger.info(f"📍 Port: {port}")
+    logger.info(f"🌐 Translator: {'✅ Available' if TRANSLATOR_AVAILABLE else '❌ Not Available'}")
+    logger.info("📋 Endpoints:")
+    logger.info("   GET  /               - Frontend")
+    logger.info("   POST /phi            - AI chat (with auto-translation)")
+    logger.info("   POST /api/translate  - Manual translation")
+    logger.info("   POST /api/vision     - Vision")
+    logger.info("=" * 60)
+    
+    # ✅ WARM UP PHI + TRANSLATOR in the background so the server binds immediately
+    if os.environ.get("PHI_WARMUP", "1") == "1":
+        threading.Thread(target=_warmup, daemon=True).start()
     
     logger.info("=" * 60)
     
-    app.run(host="0.0.0.0", port=port, debug=True, threaded=True)
\ No newline at end of file
+    # Development server only; in production run: gunicorn -c gunicorn.conf.py app:app
+    debug = os.environ.get("FLASK_ENV") == "development"
+    if not debug:
+        logger.info("💡 For production use: gunicorn -c gunicorn.conf.py app:app")
+    app.run(host="0.0.0.0", port=port, debug=debug, threaded=True)
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Gunicorn config for the AI Digital Human server
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Vision sessions and caches live in process memory, so a session started on
+# one worker would not be visible to another. Scale with threads, not workers.
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 2 * (os.cpu_count() or 1) + 1))
+
+# Phi inference plus translation can take several seconds per request
+timeout = 60
+keepalive = 5
+
+# gunicorn 21.2.0 (the pinned release) has no buf_read_size setting: sockets are
+# read in fixed 8 KiB chunks. Request size is capped by Flask's MAX_CONTENT_LENGTH.
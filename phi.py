@@ -1,13 +1,139 @@
 import logging
+import os
+import re
+import threading
 import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 1
 TIMEOUT = 20
+OLLAMA_HOST = "http://127.0.0.1:11434"
+# Phi-3 mini; the default Ollama tag is Q4_K_M quantized
+PHI_MODEL = "phi3:mini"
+# Keep the model loaded between calls so its weights and prompt cache stay warm
+KEEP_ALIVE = "30m"
+
+LANG_NAMES = {"hi": "Hindi", "ta": "Tamil", "te": "Telugu", "kn": "Kannada", "ml": "Malayalam"}
+
+# ✅ LANGUAGE INSTRUCTIONS (shared with vision.py)
+_LANG_INSTRUCTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "en": "Respond in English.",
+    "hi": "Respond in Hindi (हिन्दी में).",
+    "ta": "Respond in Tamil (தமிழில்).",
+    "te": "Respond in Telugu (తెలుగులో).",
+    "kn": "Respond in Kannada (ಕನ್ನಡದಲ್ಲಿ).",
+    "ml": "Respond in Malayalam (മലയാളത്തിൽ)."
+})
+
+_CHAT_SYSTEM_PROMPTS: Final[Mapping[str, str]] = MappingProxyType({
+    lang: f"You are a helpful AI assistant. {instruction} Be conversational and natural. Keep answer very brief (1-2 sentences max)."
+    for lang, instruction in _LANG_INSTRUCTIONS.items()
+})
+
+# Sampling options shared by ask_phi and ask_phi_stream
+_CHAT_OPTIONS: Final[Mapping[str, object]] = MappingProxyType({
+    "temperature": 0.8,
+    "num_predict": 80,
+    "num_ctx": 512,
+    "num_batch": 512,
+    "top_k": 40,
+    "top_p": 0.9,
+    "stop": ["\n\n"]
+})
+
+_ERROR_MESSAGES: Final[Mapping[str, str]] = MappingProxyType({
+    "hi": "क्षमा करें, मुझे समस्या हो रही है। कृपया पुनः प्रयास करें।",
+    "ta": "மன்னிக்கவும், எனக்கு சிக்கல் உள்ளது. மீண்டும் முயற்சிக்கவும்.",
+    "te": "క్షమించండి, నాకు సమస్య ఉంది. మళ్లీ ప్రయత్నించండి.",
+    "kn": "ಕ್ಷಮಿಸಿ, ನನಗೆ ಸಮಸ್ಯೆ ಇದೆ. ಮತ್ತೆ ಪ್ರಯತ್ನಿಸಿ.",
+    "ml": "ക്ഷമിക്കണം, എനിക്ക് പ്രശ്നമുണ്ട്. വീണ്ടും ശ്രമിക്കുക.",
+    "en": "Sorry, I'm having trouble. Please try again."
+})
+
+_TECHNICAL_ERROR_MESSAGES: Final[Mapping[str, str]] = MappingProxyType({
+    "hi": "मुझे तकनीकी समस्या है।",
+    "ta": "எனக்கு தொழில்நுட்ப சிக்கல் உள்ளது.",
+    "te": "నాకు సాంకేతిక సమస్య ఉంది.",
+    "kn": "ನನಗೆ ತಾಂತ್ರಿಕ ಸಮಸ್ಯೆ ಇದೆ.",
+    "ml": "എനിക്ക് സാങ്കേതിക പ്രശ്നമുണ്ട്.",
+    "en": "Technical difficulty."
+})
+
+# Sentence boundary: whitespace after ., !, ? or the Devanagari danda
+_SENT_RE = re.compile(r"(?<=[.!?।])\s+")
+
+try:
+    from langdetect import DetectorFactory, LangDetectException, detect
+    DetectorFactory.seed = 0  # deterministic detection
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    LANGDETECT_AVAILABLE = False
+
+# Local NLLB-200 translator (optional), converted with the tokenizer copied alongside
+# so nothing is fetched from the Hugging Face hub at runtime:
+#   ct2-transformers-converter --model facebook/nllb-200-distilled-600M --quantization int8 --output_dir nllb-ct2 \
+#       --copy_files tokenizer.json tokenizer_config.json special_tokens_map.json sentencepiece.bpe.model
+NLLB_MODEL_DIR = os.environ.get("NLLB_MODEL_DIR", "nllb-ct2")
+NLLB_CODES = {"en": "eng_Latn", "hi": "hin_Deva", "ta": "tam_Taml", "te": "tel_Telu", "kn": "kan_Knda", "ml": "mal_Mlym"}
+
+# Only import ctranslate2/transformers (slow) when a converted model is present
+_nllb = None
+if os.path.isdir(NLLB_MODEL_DIR):
+    try:
+        import ctranslate2
+        from transformers import AutoTokenizer
+        _nllb = ctranslate2.Translator(NLLB_MODEL_DIR, device="auto", compute_type="int8")
+    except ImportError:
+        logger.warning("⚠️ NLLB model found but ctranslate2/transformers missing, using Phi for translation")
+    except Exception as e:
+        logger.warning(f"⚠️ NLLB translator failed to load, using Phi for translation: {e}")
+
+@lru_cache(maxsize=None)
+def _nllb_tokenizer(src_code):
+    return AutoTokenizer.from_pretrained(NLLB_MODEL_DIR, src_lang=src_code)
+
+def _nllb_translate(text, source_lang, target_lang):
+    """Translate with the local NLLB model (deterministic greedy decode)"""
+    tokenizer = _nllb_tokenizer(NLLB_CODES[source_lang])
+    source = tokenizer.convert_ids_to_tokens(tokenizer.encode(text))
+    result = _nllb.translate_batch([source], target_prefix=[[NLLB_CODES[target_lang]]], beam_size=1)
+    target = result[0].hypotheses[0][1:]  # drop the language tag
+    return tokenizer.decode(tokenizer.convert_tokens_to_ids(target), skip_special_tokens=True)
 
 # ✅ TRY IMPORTING OLLAMA WITH ERROR HANDLING
+try:
+    import ollama
+    OLLAMA_AVAILABLE = True
+    # One client per process keeps an HTTP keep-alive pool to the Ollama server
+    _client = ollama.Client(host=OLLAMA_HOST, timeout=TIMEOUT)
+except ImportError:
+    OLLAMA_AVAILABLE = False
+    _client = None
+    logger.warning("⚠️ ollama library not available. Run: pip install ollama")
+
+PRELOAD_RETRIES = 5
+
+def _warm():
+    """Load Phi into Ollama with a 1-token request so the first user turn skips the cold load"""
+    delay = 1
+    for attempt in range(PRELOAD_RETRIES):
+        try:
+            _client.generate(model=PHI_MODEL, prompt=".", options={"num_predict": 1}, keep_alive=KEEP_ALIVE)
+            logger.info(f"🔥 {PHI_MODEL} preloaded")
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Phi preload failed (attempt {attempt + 1}): {e}")
+            time.sleep(delay)
+            delay *= 2
+
+# Runs on import, so it also covers gunicorn workers; set PHI_PRELOAD=0 to disable
+if OLLAMA_AVAILABLE and os.environ.get("PHI_PRELOAD", "1") == "1":
+    threading.Thread(target=_warm, daemon=True).start()
 
     
     return "neutral", 0.5
@@ -17,40 +143,26 @@ TIMEOUT = 20
             logger.info(f"🧠 Phi request [{lang}] (attempt {attempt + 1}): {message[:50]}...")
             start_time = time.time()
             
-            # Language instructions
-            lang_instructions = {
-                "hi": "You are a helpful AI assistant. Respond in Hindi (हिन्दी में). Be conversational and natural. Keep answer very brief (1-2 sentences max).",
-                "ta": "You are a helpful AI assistant. Respond in Tamil (தமிழில்). Be conversational and natural. Keep answer very brief (1-2 sentences max).",
-                "te": "You are a helpful AI assistant. Respond in Telugu (తెలుగులో). Be conversational and natural. Keep answer very brief (1-2 sentences max).",
-                "kn": "You are a helpful AI assistant. Respond in Kannada (ಕನ್ನಡದಲ್ಲಿ). Be conversational and natural. Keep answer very brief (1-2 sentences max).",
-                "ml": "You are a helpful AI assistant. Respond in Malayalam (മലയാളത്തിൽ). Be conversational and natural. Keep answer very brief (1-2 sentences max).",
-                "en": "You are a helpful AI assistant. Respond in English. Be conversational, friendly and natural. Keep answer very brief (1-2 sentences max)."
-            }
-            
-            system_prompt = lang_instructions.get(lang, lang_instructions["en"])
+            system_prompt = _CHAT_SYSTEM_PROMPTS.get(lang, _CHAT_SYSTEM_PROMPTS["en"])
             
             logger.info(f"💬 Calling Ollama Phi...")
             
             # ✅ SIMPLE OLLAMA CALL - Uses default port 11434
-            response = ollama.chat(
-                model="phi",
+            response = _client.chat(
+                model=PHI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": message}
                 ],
-                options={
-                    "temperature": 0.8,
-                    "num_predict": 80,
-                    "top_k": 40,
-                    "top_p": 0.9
-                }
+                options=dict(_CHAT_OPTIONS),  # JSON needs a plain dict
+                keep_alive=KEEP_ALIVE
             )
         
             
             # Limit to 2 sentences max
-            sentences = [s.strip() for s in reply.replace('। ', '. ').split('. ') if s.strip()]
+            sentences = _SENT_RE.split(reply, maxsplit=2)
             if len(sentences) > 2:
-                reply = '. '.join(sentences[:2]) + '.'
+                reply = " ".join(sentences[:2])
             
             elapsed = time.time() - start_time
             logger.info(f"✅ Phi response [{elapsed:.2f}s]: {reply[:60]}...")
@@ -69,15 +181,7 @@ TIMEOUT = 20
                 break
     
     # Fallback error message
-    error_messages = {
-        "hi": "क्षमा करें, मुझे समस्या हो रही है। कृपया पुनः प्रयास करें।",
-        "ta": "மன்னிக்கவும், எனக்கு சிக்கல் உள்ளது. மீண்டும் முயற்சிக்கவும்.",
-        "te": "క్షమించండి, నాకు సమస్య ఉంది. మళ్లీ ప్రయత్నించండి.",
-        "kn": "ಕ್ಷಮಿಸಿ, ನನಗೆ ಸಮಸ್ಯೆ ಇದೆ. ಮತ್ತೆ ಪ್ರಯತ್ನಿಸಿ.",
-        "ml": "ക്ഷമിക്കണം, എനിക്ക് പ്രശ്നമുണ്ട്. വീണ്ടും ശ്രമിക്കുക.",
-        "en": "Sorry, I'm having trouble. Please try again."
-    }
-    return error_messages.get(lang, error_messages["en"])
+    return _ERROR_MESSAGES.get(lang, _ERROR_MESSAGES["en"])
 
 
         if isinstance(response, dict) and "message" in response:
@@ -86,6 +190,39 @@ TIMEOUT = 20
     except:
         return text
 
+def reply_matches_language(reply, lang):
+    """Check with langdetect whether a reply is written in lang"""
+    if not LANGDETECT_AVAILABLE:
+        return True
+    try:
+        return detect(reply) == lang
+    except LangDetectException:
+        return True
+
+@lru_cache(maxsize=2048)
+def _translate_from_english_cached(text, target_lang):
+    """Translation (local NLLB, else Phi) memoized on (text, target_lang); raises instead of caching failures"""
+    if _nllb is not None and target_lang in NLLB_CODES:
+        try:
+            return _nllb_translate(text, "en", target_lang)
+        except Exception as e:
+            logger.warning(f"⚠️ NLLB translation failed, using Phi: {e}")
+    
+    response = _client.chat(
+        model=PHI_MODEL,
+        messages=[
+            {"role": "system", "content": f"Translate to {LANG_NAMES.get(target_lang, target_lang)}. Only output the translation."},
+            {"role": "user", "content": text}
+        ],
+        options={"temperature": 0.3, "num_predict": 150, "num_ctx": 256},
+        keep_alive=KEEP_ALIVE
+    )
+    
+    translated = response["message"].get("content", "").strip()
+    if not translated:
+        raise ValueError("Empty translation")
+    return translated
+
 def translate_from_english(text, target_lang):
     """Translate from English"""
     if target_lang == "en":
@@ -93,26 +230,13 @@ def translate_from_english(text, target_lang):
     
     try:
         logger.info(f"🌐 Translating [en] → [{target_lang}]")
-        
-        lang_names = {"hi": "Hindi", "ta": "Tamil", "te": "Telugu", "kn": "Kannada", "ml": "Malayalam"}
-        
-        response = ollama.chat(
-            model="phi",
-            messages=[
-                {"role": "system", "content": f"Translate to {lang_names.get(target_lang, target_lang)}. Only output the translation."},
-                {"role": "user", "content": text}
-            ],
-            options={"temperature": 0.3, "num_predict": 150}
-        )
-        
-        if isinstance(response, dict) and "message" in response:
-            return response["message"].get("content", "").strip() or text
-        return text
+        return _translate_from_english_cached(text, target_lang)
     except:
         return text
         
-        # Translate back to user's language
-        if lang != "en":
+        # Phi is asked to answer in the user's language directly; only fall back
+        # to a translation hop when the reply came back in another language
+        if lang != "en" and not reply_matches_language(reply, lang):
             reply = translate_from_english(reply, lang)
             logger.info(f"✅ Translated [{lang}]: '{reply}'")
         
@@ -122,25 +246,28 @@ def translate_from_english(text, target_lang):
     except Exception as e:
         logger.exception(f"❌ Error: {e}")
         
-        error_messages = {
-            "hi": "मुझे तकनीकी समस्या है।",
-            "ta": "எனக்கு தொழில்நுட்ப சிக்கல் உள்ளது.",
-            "te": "నాకు సాంకేతిక సమస్య ఉంది.",
-            "kn": "ನನಗೆ ತಾಂತ್ರಿಕ ಸಮಸ್ಯೆ ಇದೆ.",
-            "ml": "എനിക്ക് സാങ്കേതിക പ്രശ്നമുണ്ട്.",
-            "en": "Technical difficulty."
-        }
-        return error_messages.get(lang, error_messages["en"]), "neutral", 0.5
-
-# ✅ LANGUAGE INSTRUCTIONS (for vision.py)
-LANGUAGE_INSTRUCTIONS = {
-    "en": "Respond in English.",
-    "hi": "Respond in Hindi (हिन्दी में).",
-    "ta": "Respond in Tamil (தமிழில்).",
-    "te": "Respond in Telugu (తెలుగులో).",
-    "kn": "Respond in Kannada (ಕನ್ನಡದಲ್ಲಿ).",
-    "ml": "Respond in Malayalam (മലയാളത്തിൽ)."
-}
+        return _TECHNICAL_ERROR_MESSAGES.get(lang, _TECHNICAL_ERROR_MESSAGES["en"]), "neutral", 0.5
+
+# ✅ STREAMING (first sentence can be spoken while the rest is generated)
+
+def ask_phi_stream(message, lang="en"):
+    """Yield Phi reply chunks as Ollama generates them"""
+    system_prompt = _CHAT_SYSTEM_PROMPTS.get(lang, _CHAT_SYSTEM_PROMPTS["en"])
+    
+    stream = _client.chat(
+        model=PHI_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": message}
+        ],
+        options=dict(_CHAT_OPTIONS),  # JSON needs a plain dict
+        keep_alive=KEEP_ALIVE,
+        stream=True
+    )
+    for chunk in stream:
+        content = chunk["message"]["content"]
+        if content:
+            yield content
 
 if __name__ == "__main__":
     print("🧪 Testing Phi AI...\n")
@@ -1,20 +1,83 @@
+import os
+import queue
 import speech_recognition as sr
 
-def listen_microphone():
+# Local faster-whisper STT (optional): no network round trip, int8 weights
+try:
+    import numpy as np
+    import sounddevice as sd
+    from faster_whisper import WhisperModel
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 4000          # 250 ms of audio per callback
+SILENCE_RMS = 500          # int16 RMS below this counts as silence
+SILENCE_BLOCKS = 4         # ~1 s of silence after speech ends the utterance
+MAX_BLOCKS = 60            # hard cap of ~15 s per utterance
+
+_whisper = None
+if WHISPER_AVAILABLE:
+    try:
+        _whisper = WhisperModel(
+            os.environ.get("WHISPER_MODEL", "small"),
+            device="auto",
+            compute_type=os.environ.get("WHISPER_COMPUTE_TYPE", "int8")
+        )
+    except Exception as e:
+        # e.g. offline first run or a bad WHISPER_MODEL: fall back to Google
+        print("Whisper model failed to load:", e)
+
+def _record_utterance():
+    """Record from the mic until a pause follows speech; returns float32 PCM"""
+    blocks = queue.Queue()
+    
+    def callback(indata, frames, time_info, status):
+        blocks.put(bytes(indata))
+    
+    audio = []
+    heard_speech = False
+    silent = 0
+    with sd.RawInputStream(samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE, dtype="int16",
+                           channels=1, callback=callback):
+        print("🎤 Speak now...")
+        while len(audio) < MAX_BLOCKS:
+            block = np.frombuffer(blocks.get(), dtype=np.int16)
+            audio.append(block)
+            rms = np.sqrt(np.mean(block.astype(np.float32) ** 2))
+            if rms >= SILENCE_RMS:
+                heard_speech = True
+                silent = 0
+            elif heard_speech:
+                silent += 1
+                if silent >= SILENCE_BLOCKS:
+                    break
+    return np.concatenate(audio).astype(np.float32) / 32768.0
+
+def listen_microphone_stream(language="en"):
+    """Yield transcript segments as faster-whisper decodes them"""
+    segments, _ = _whisper.transcribe(_record_utterance(), language=language, vad_filter=True)
+    for segment in segments:
+        yield segment.text.strip()
+
+def listen_microphone(language="en-IN"):
+    if _whisper is not None:
+        # Whisper takes bare language codes ("en"), Google takes locales ("en-IN")
+        text = " ".join(listen_microphone_stream(language.split("-", 1)[0]))
+        print("📝 You said:", text)
+        return text or "Sorry, I could not understand."
+    
     recognizer = sr.Recognizer()
     with sr.Microphone() as source:
         print("🎤 Speak now...")
         audio = recognizer.listen(source)
         try:
-            # Use Indian English to support more accents, or change to "hi-IN", etc.
-            text = recognizer.recognize_google(audio, language="en-IN")
+            # Indian English by default to support more accents; pass "hi-IN", etc.
+            text = recognizer.recognize_google(audio, language=language)
             print("📝 You said:", text)
             return text
         except sr.UnknownValueError:
             return "Sorry, I could not understand."
         except sr.RequestError:
             return "Error accessing the Speech API."
-
-
-
-###'https://models.readyplayer.me/68497e671a5c93881e8e6acd.glb'
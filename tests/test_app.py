@@ -0,0 +1,48 @@
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+
+
+class ApiVisionTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+        # vision loads YOLO and the camera stack; the route imports it lazily,
+        # so a bare module is enough for mock.patch to replace the cycle on
+        self.modules = mock.patch.dict(sys.modules, {"vision": sys.modules.get("vision") or types.ModuleType("vision")})
+        self.modules.start()
+        self.addCleanup(self.modules.stop)
+
+    def test_runs_vision_cycle_once_per_request(self):
+        result = {
+            "response": "Path is clear.",
+            "emotion": "neutral",
+            "emotion_intensity": 0.5,
+            "source": "vision_detection",
+            "detections": [],
+            "objects_count": 0
+        }
+        with mock.patch("vision.vision_assistant_cycle", create=True, return_value=result) as cycle:
+            response = self.client.post("/api/vision", json={"language": "en"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["response"], "Path is clear.")
+        self.assertEqual(cycle.call_count, 1)
+
+    def test_stream_runs_vision_cycle_once(self):
+        result = {"response": "Path is clear.", "emotion": "neutral", "emotion_intensity": 0.5}
+        with mock.patch("vision.vision_assistant_cycle", create=True, return_value=result) as cycle:
+            response = self.client.post("/api/vision", json={"language": "en", "stream": True})
+            lines = response.get_data(as_text=True).splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(cycle.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
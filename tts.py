@@ -1,13 +1,76 @@
 from gtts import gTTS
 from playsound import playsound
-from langdetect import detect
+from langdetect import DetectorFactory, detect
+import queue
+import re
 import tempfile
+import threading
 import os
+from functools import lru_cache
 
-def speak(text):
+# Google's CLD3 (C++) is much faster than langdetect; fall back when missing
+try:
+    import cld3
+    CLD3_AVAILABLE = True
+except ImportError:
+    CLD3_AVAILABLE = False
+
+DetectorFactory.seed = 0  # deterministic langdetect fallback
+
+# Local Piper TTS (optional): streams PCM straight to the sound card, no network
+try:
+    import numpy as np
+    import sounddevice as sd
+    from piper.voice import PiperVoice
+    PIPER_AVAILABLE = True
+except ImportError:
+    PIPER_AVAILABLE = False
+
+# One voice per language, stored as <lang>.onnx (+ <lang>.onnx.json)
+PIPER_VOICE_DIR = os.environ.get("PIPER_VOICE_DIR", "voices")
+
+# End of a sentence inside streamed text: terminator followed by whitespace
+_SENTENCE_END_RE = re.compile(r"[.!?।]\s")
+
+def _load_piper_voices():
+    voices = {}
+    if not PIPER_AVAILABLE or not os.path.isdir(PIPER_VOICE_DIR):
+        return voices
+    for name in os.listdir(PIPER_VOICE_DIR):
+        if name.endswith(".onnx"):
+            try:
+                voices[name[:-len(".onnx")]] = PiperVoice.load(os.path.join(PIPER_VOICE_DIR, name))
+            except Exception as e:
+                print(f"Piper voice {name} failed to load:", e)
+    return voices
+
+_piper_voices = _load_piper_voices()
+
+def _speak_piper(voice, text):
+    with sd.OutputStream(samplerate=voice.config.sample_rate, channels=1, dtype="int16") as stream:
+        for audio_bytes in voice.synthesize_stream_raw(text):
+            stream.write(np.frombuffer(audio_bytes, dtype=np.int16))
+
+@lru_cache(maxsize=1024)
+def _detect_language(text):
+    """Detect language (hi, en, te, etc.), memoized per exact string"""
+    if CLD3_AVAILABLE:
+        prediction = cld3.get_language(text)
+        if prediction is not None and prediction.is_reliable:
+            return prediction.language
+    return detect(text)
+
+def speak(text, lang=None):
+    """Speak text; pass lang when the caller already knows it to skip detection"""
     try:
-        lang = detect(text)  # auto detect language (hi, en, te, etc.)
-        print(f"🔍 Detected language for TTS: {lang}")
+        if lang is None:
+            lang = _detect_language(text)
+            print(f"🔍 Detected language for TTS: {lang}")
+        voice = _piper_voices.get(lang)
+        if voice is not None:
+            _speak_piper(voice, text)
+            return
+        # No local voice for this language: fall back to Google TTS
         tts = gTTS(text=text, lang=lang)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
             temp_path = fp.name
@@ -16,3 +79,35 @@ def speak(text):
         os.remove(temp_path)
     except Exception as e:
         print("TTS Error:", e)
+
+def _speak_worker(sentences, lang):
+    while True:
+        sentence = sentences.get()
+        if sentence is None:
+            break
+        speak(sentence, lang)
+
+def speak_stream(chunks, lang=None):
+    """Speak streamed text (e.g. phi.ask_phi_stream) sentence by sentence; returns the full text"""
+    sentences = queue.Queue()
+    worker = threading.Thread(target=_speak_worker, args=(sentences, lang), daemon=True)
+    worker.start()
+    
+    parts = []
+    buffer = ""
+    try:
+        for chunk in chunks:
+            parts.append(chunk)
+            buffer += chunk
+            match = _SENTENCE_END_RE.search(buffer)
+            while match:
+                sentences.put(buffer[:match.end()].strip())
+                buffer = buffer[match.end():]
+                match = _SENTENCE_END_RE.search(buffer)
+        if buffer.strip():
+            sentences.put(buffer.strip())
+    finally:
+        # Always release the worker, even if the stream fails mid-way
+        sentences.put(None)
+        worker.join()
+    return "".join(parts)